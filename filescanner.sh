@@ -72,65 +72,96 @@ files=""
 
 echo "Parsing config..."
 
+# Split a comma-separated pattern list into the PATTERNS array, trimming
+# each entry with parameter expansion (no subshell per entry)
+split_patterns() {
+    local p
+    PATTERNS=()
+    IFS=',' read -ra _RAW_PATTERNS <<< "$1"
+    for p in "${_RAW_PATTERNS[@]}"; do
+        p="${p#"${p%%[![:space:]]*}"}"
+        p="${p%"${p##*[![:space:]]}"}"
+        [[ -n "$p" ]] && PATTERNS+=("$p")
+    done
+}
+
+# Build a single find name group: \( -name "a" -o -name "b" ... \)
+build_name_group() {
+    local p sep=""
+    split_patterns "$1"
+    NAME_GROUP="\\("
+    for p in "${PATTERNS[@]}"; do
+        NAME_GROUP="$NAME_GROUP$sep -name \"$p\""
+        sep=" -o"
+    done
+    NAME_GROUP="$NAME_GROUP \\)"
+}
+
+# Join keywords into one alternation: "a, b,c" -> "a|b|c" (same as sed 's/, */|/g')
+join_keywords() {
+    KEYWORD_PATTERN="$1"
+    while [[ "$KEYWORD_PATTERN" == *", "* ]]; do
+        KEYWORD_PATTERN="${KEYWORD_PATTERN//, /,}"
+    done
+    KEYWORD_PATTERN="${KEYWORD_PATTERN//,/|}"
+}
+
+# Build a quoted PowerShell array body: 'a','b' (single quotes doubled)
+build_include_array() {
+    local p q="'" sep=""
+    split_patterns "$1"
+    INCLUDE_ARRAY=""
+    for p in "${PATTERNS[@]}"; do
+        INCLUDE_ARRAY="$INCLUDE_ARRAY$sep$q${p//$q/$q$q}$q"
+        sep=","
+    done
+}
+
+# Builders store their result in BUILT_CMD (no command substitution subshell)
 build_linux_command() {
     local cmd="$1"
     local kw="$2"
     local ext="$3"
     local fls="$4"
     
+    # Classify the command once
+    local kind=""
+    case "$cmd" in
+        *grep*) kind="grep" ;;
+        *find*) kind="find" ;;
+    esac
+    
     # Replace KEYWORDS
     if [[ -n "$kw" ]] && [[ "$cmd" == *"KEYWORDS"* ]]; then
-        local keyword_pattern=$(echo "$kw" | sed 's/, */|/g')
-        cmd="${cmd//KEYWORDS/$keyword_pattern}"
+        join_keywords "$kw"
+        cmd="${cmd//KEYWORDS/$KEYWORD_PATTERN}"
     fi
     
-    # Replace EXTENSIONS (grep style)
+    # Replace EXTENSIONS (--include flags for grep, -name group for find)
     if [[ -n "$ext" ]] && [[ "$cmd" == *"EXTENSIONS"* ]]; then
-        if [[ "$cmd" == *"grep"* ]]; then
-            local include_flags=""
-            IFS=',' read -ra EXTS <<< "$ext"
-            for e in "${EXTS[@]}"; do
-                e=$(echo "$e" | xargs)
-                include_flags="$include_flags --include=\"$e\""
-            done
-            cmd="${cmd//EXTENSIONS/$include_flags}"
-        elif [[ "$cmd" == *"find"* ]]; then
-            local name_flags="\\("
-            IFS=',' read -ra EXTS <<< "$ext"
-            local first=true
-            for e in "${EXTS[@]}"; do
-                e=$(echo "$e" | xargs)
-                if [[ "$first" == true ]]; then
-                    name_flags="$name_flags -name \"$e\""
-                    first=false
-                else
-                    name_flags="$name_flags -o -name \"$e\""
-                fi
-            done
-            name_flags="$name_flags \\)"
-            cmd="${cmd//EXTENSIONS/$name_flags}"
-        fi
+        case "$kind" in
+            grep)
+                local include_flags="" e
+                split_patterns "$ext"
+                for e in "${PATTERNS[@]}"; do
+                    include_flags="$include_flags --include=\"$e\""
+                done
+                cmd="${cmd//EXTENSIONS/$include_flags}"
+                ;;
+            find)
+                build_name_group "$ext"
+                cmd="${cmd//EXTENSIONS/$NAME_GROUP}"
+                ;;
+        esac
     fi
     
     # Replace FILES
     if [[ -n "$fls" ]] && [[ "$cmd" == *"FILES"* ]]; then
-        local name_flags="\\("
-        IFS=',' read -ra FILES_ARR <<< "$fls"
-        local first=true
-        for f in "${FILES_ARR[@]}"; do
-            f=$(echo "$f" | xargs)
-            if [[ "$first" == true ]]; then
-                name_flags="$name_flags -name \"$f\""
-                first=false
-            else
-                name_flags="$name_flags -o -name \"$f\""
-            fi
-        done
-        name_flags="$name_flags \\)"
-        cmd="${cmd//FILES/$name_flags}"
+        build_name_group "$fls"
+        cmd="${cmd//FILES/$NAME_GROUP}"
     fi
     
-    echo "$cmd"
+    BUILT_CMD="$cmd"
 }
 
 build_windows_command() {
@@ -141,47 +172,42 @@ build_windows_command() {
     
     # Replace KEYWORDS
     if [[ -n "$kw" ]] && [[ "$cmd" == *"KEYWORDS"* ]]; then
-        local keyword_pattern=$(echo "$kw" | sed 's/, */|/g')
-        keyword_pattern=$(echo "$keyword_pattern" | sed "s/'/''/g")
-        cmd="${cmd//KEYWORDS/$keyword_pattern}"
+        local q="'"
+        join_keywords "$kw"
+        cmd="${cmd//KEYWORDS/${KEYWORD_PATTERN//$q/$q$q}}"
     fi
     
     # Replace EXTENSIONS (Robust Array)
     if [[ -n "$ext" ]] && [[ "$cmd" == *"EXTENSIONS"* ]]; then
-        # Escape single quotes in extensions
-        local clean_ext=$(echo "$ext" | sed "s/'/''/g")
         # Convert comma-separated list to PowerShell array format with quotes
-        local ps_array="'$(echo "$clean_ext" | sed "s/[[:space:]]*,[[:space:]]*/','/g")'"
+        build_include_array "$ext"
         # Replace EXTENSIONS with the full -Include parameter
-        cmd="${cmd//EXTENSIONS/-Include @($ps_array)}"
+        cmd="${cmd//EXTENSIONS/-Include @($INCLUDE_ARRAY)}"
     fi
     
     # Replace FILES (Robust Array)
     if [[ -n "$fls" ]] && [[ "$cmd" == *"FILES"* ]]; then
-        # Escape single quotes in filenames
-        local clean_fls=$(echo "$fls" | sed "s/'/''/g")
         # Convert comma-separated list to PowerShell array format with quotes
-        local ps_array="'$(echo "$clean_fls" | sed "s/[[:space:]]*,[[:space:]]*/','/g")'"
+        build_include_array "$fls"
         # Replace FILES with the full -Include parameter
-        cmd="${cmd//FILES/-Include @($ps_array)}"
+        cmd="${cmd//FILES/-Include @($INCLUDE_ARRAY)}"
     fi
 
     # SAFETY: If EXTENSIONS or FILES remain (because var was empty), remove them to prevent syntax errors
     cmd="${cmd//EXTENSIONS/}"
     cmd="${cmd//FILES/}"
     
-    echo "$cmd"
+    BUILT_CMD="$cmd"
 }
 
 process_section() {
     if [[ -n "$linux_cmd" ]] && [[ -n "$windows_cmd" ]]; then
         # Build actual commands
-        local final_linux=$(build_linux_command "$linux_cmd" "$keywords" "$extensions" "$files")
-        local final_windows=$(build_windows_command "$windows_cmd" "$keywords" "$extensions" "$files")
-        
+        build_linux_command "$linux_cmd" "$keywords" "$extensions" "$files"
+        LINUX_COMMANDS+=("$BUILT_CMD")
+        build_windows_command "$windows_cmd" "$keywords" "$extensions" "$files"
+        WINDOWS_COMMANDS+=("$BUILT_CMD")
         SECTION_NAMES+=("$current_section")
-        LINUX_COMMANDS+=("$final_linux")
-        WINDOWS_COMMANDS+=("$final_windows")
         
         echo "  ✓ $current_section"
     fi
@@ -195,30 +221,34 @@ process_section() {
 }
 
 while IFS= read -r line || [[ -n "$line" ]]; do
-    line=$(echo "$line" | sed 's/^[[:space:]]*//;s/[[:space:]]*$//')
+    # Trim with parameter expansion (no echo|sed subshell per line)
+    line="${line#"${line%%[![:space:]]*}"}"
+    line="${line%"${line##*[![:space:]]}"}"
     
     # Skip empty lines and comments
-    [[ -z "$line" ]] || [[ "$line" =~ ^# ]] && continue
+    [[ -z "$line" ]] || [[ "$line" == \#* ]] && continue
     
     # Section header
-    if [[ "$line" =~ ^\[(.+)\]$ ]]; then
+    if [[ "$line" == \[?*\] ]]; then
         process_section
-        current_section="${BASH_REMATCH[1]}"
+        current_section="${line:1:${#line}-2}"
         continue
     fi
     
-    # Parse fields with flexible regex (handles tabs/spaces)
-    if [[ "$line" =~ ^"Linux Command:"[[:space:]]*(.+)$ ]]; then
-        linux_cmd="${BASH_REMATCH[1]}"
-    elif [[ "$line" =~ ^"Windows Command:"[[:space:]]*(.+)$ ]]; then
-        windows_cmd="${BASH_REMATCH[1]}"
-    elif [[ "$line" =~ ^"Keywords:"[[:space:]]*(.+)$ ]]; then
-        keywords="${BASH_REMATCH[1]}"
-    elif [[ "$line" =~ ^"Extensions:"[[:space:]]*(.+)$ ]]; then
-        extensions="${BASH_REMATCH[1]}"
-    elif [[ "$line" =~ ^"Files:"[[:space:]]*(.+)$ ]]; then
-        files="${BASH_REMATCH[1]}"
-    fi
+    # Parse fields by prefix (glob match, no regex compiled per line)
+    [[ "$line" == *:* ]] || continue
+    field="${line%%:*}"
+    value="${line#*:}"
+    value="${value#"${value%%[![:space:]]*}"}"
+    [[ -z "$value" ]] && continue
+    
+    case "$field" in
+        "Linux Command")   linux_cmd="$value" ;;
+        "Windows Command") windows_cmd="$value" ;;
+        "Keywords")        keywords="$value" ;;
+        "Extensions")      extensions="$value" ;;
+        "Files")           files="$value" ;;
+    esac
 done < "$CONFIG_FILE"
 
 # Process last section
@@ -231,7 +261,9 @@ echo ""
 # Generate PowerShell standalone
 echo "Generating standalone PowerShell script..."
 
-cat > "$OUTPUT_PS1" << 'PS_HEADER'
+# The whole script is written through one redirection (one open/close)
+{
+cat << 'PS_HEADER'
 # File Scanner - PowerShell Module
 # Auto-generated with pre-built commands - no parsing needed!
 #
@@ -300,73 +332,77 @@ function Invoke-FileScan {
         New-Item -ItemType Directory -Path $outputDir -Force | Out-Null
     }
 
-    # Initialize output file
-    $timestamp = Get-Date -Format "yyyy-MM-dd HH:mm:ss"
-    @(
-        "=" * 80
-        "File Scanner Results"
-        "=" * 80
-        "Scan started: $timestamp"
-        "Search root: $SearchRoot"
-        "Output file: $OutputFile"
-        "=" * 80
-        ""
-    ) | Out-File -FilePath $OutputFile -Encoding UTF8
-
-    Write-Host "[*] File Scanner - Module Mode" -ForegroundColor Cyan
-    Write-Host "[*] Search Root: $SearchRoot" -ForegroundColor Cyan
-    Write-Host "[*] Output File: $OutputFile" -ForegroundColor Cyan
-    Write-Host ""
-
-    # Helper function to log
-    function Log {
-        param([string]$message, [bool]$toConsole = $false)
-        if ($toConsole -or $VerbosePreference -eq 'Continue') {
-            Write-Host $message
+    # Open the output file once with one encoding; header, results and
+    # footer all go through this buffered writer
+    $outputPath = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($OutputFile)
+    $writer = New-Object System.IO.StreamWriter($outputPath, $false, [System.Text.Encoding]::UTF8, 1MB)
+    try {
+        # Initialize output file
+        $timestamp = Get-Date -Format "yyyy-MM-dd HH:mm:ss"
+        @(
+            "=" * 80
+            "File Scanner Results"
+            "=" * 80
+            "Scan started: $timestamp"
+            "Search root: $SearchRoot"
+            "Output file: $OutputFile"
+            "=" * 80
+            ""
+        ) | ForEach-Object { $writer.WriteLine($_) }
+
+        Write-Host "[*] File Scanner - Module Mode" -ForegroundColor Cyan
+        Write-Host "[*] Search Root: $SearchRoot" -ForegroundColor Cyan
+        Write-Host "[*] Output File: $OutputFile" -ForegroundColor Cyan
+        Write-Host ""
+
+        # Helper function to log
+        function Log {
+            param([string]$message, [bool]$toConsole = $false)
+            if ($toConsole -or $VerbosePreference -eq 'Continue') {
+                Write-Host $message
+            }
+            $writer.WriteLine($message)
         }
-        Add-Content -Path $OutputFile -Value $message
-    }
 
-    # Function to run each section
-    function Run-Section {
-        param(
-            [string]$name,
-            [string]$command
-        )
+        # Function to run each section
+        function Run-Section {
+            param(
+                [string]$name,
+                [string]$command
+            )
         
-        Log "`n=== $name ===" $true
+            Log "`n=== $name ===" $true
         
-        if ($VerbosePreference -eq 'Continue') {
-            Log "Command: $command" $true
-        }
+            if ($VerbosePreference -eq 'Continue') {
+                Log "Command: $command" $true
+            }
         
-        try {
-            # Replace placeholder - use escaped quotes for paths with spaces
-            $actualCmd = $command.Replace('$SEARCH_ROOT', $SearchRoot)
+            try {
+                # Replace placeholder - use escaped quotes for paths with spaces
+                $actualCmd = $command.Replace('$SEARCH_ROOT', $SearchRoot)
             
-            # Execute
-            $results = Invoke-Expression $actualCmd 2>$null
+                # Execute
+                $results = Invoke-Expression $actualCmd 2>$null
             
-            if ($results) {
-                if ($results -is [Array]) {
-                    foreach ($result in $results) {
-                        Log $result ($VerbosePreference -eq 'Continue')
-                    }
+                if ($results) {
+                    # Convert once and write all results as a single block
+                    $lines = [string[]]@($results)
+                    Log ([string]::Join([Environment]::NewLine, $lines)) ($VerbosePreference -eq 'Continue')
+                    Log "Found $($lines.Count) results" $true
                 } else {
-                    Log $results ($VerbosePreference -eq 'Continue')
-                }
-                Log "Found $($results.Count) results" $true
-            } else {
-                if ($VerbosePreference -eq 'Continue') {
-                    Log "No findings" $true
+                    if ($VerbosePreference -eq 'Continue') {
+                        Log "No findings" $true
+                    }
                 }
+            } catch {
+                Log "Error: $_" $true
             }
-        } catch {
-            Log "Error: $_" $true
+        
+            # Push the section to disk so a killed session keeps its findings
+            $writer.Flush()
         }
-    }
 
-    # Execute all scan sections
+        # Execute all scan sections
 PS_HEADER
 
 # Add each section as a function call
@@ -376,10 +412,10 @@ for ((i=0; i<${#SECTION_NAMES[@]}; i++)); do
     
     # For PowerShell: Use single-quoted strings (@'...'@) for the command to avoid all escaping
     # Only the section name needs quote escaping
-    section_name_escaped=$(echo "$section_name" | sed "s/'/''/ g")
+    section_name_escaped="${section_name//\'/\'\'}"
     
     # Write using PowerShell's here-string for the command (avoids all escaping issues)
-    cat >> "$OUTPUT_PS1" << EOF
+    cat << EOF
 Run-Section '$section_name_escaped' @'
 $windows_cmd
 '@
@@ -387,16 +423,19 @@ EOF
 done
 
 # Add footer
-cat >> "$OUTPUT_PS1" << 'PS_FOOTER'
-
-    # Write footer
-    @(
-        ""
-        "=" * 80
-        "Scan completed: $(Get-Date -Format 'yyyy-MM-dd HH:mm:ss')"
-        "Results saved to: $OutputFile"
-        "=" * 80
-    ) | Add-Content -Path $OutputFile
+cat << 'PS_FOOTER'
+
+        # Write footer
+        @(
+            ""
+            "=" * 80
+            "Scan completed: $(Get-Date -Format 'yyyy-MM-dd HH:mm:ss')"
+            "Results saved to: $OutputFile"
+            "=" * 80
+        ) | ForEach-Object { $writer.WriteLine($_) }
+    } finally {
+        $writer.Close()
+    }
 
     Write-Host ""
     Write-Host "[+] Scan Complete!" -ForegroundColor Green
@@ -410,6 +449,7 @@ cat >> "$OUTPUT_PS1" << 'PS_FOOTER'
 # Function is now loaded and ready to use
 # Call it with: Invoke-FileScan -SearchRoot C:\path
 PS_FOOTER
+} > "$OUTPUT_PS1"
 
 echo "✓ Generated: $OUTPUT_PS1"
 
@@ -431,7 +471,9 @@ echo '    IEX $d'
 # Generate Bash standalone
 echo "Generating standalone Bash script..."
 
-cat > "$OUTPUT_SH" << 'BASH_HEADER'
+# The whole script is written through one redirection (one open/close)
+{
+cat << 'BASH_HEADER'
 #!/bin/bash
 
 # File Scanner - Standalone Bash Version
@@ -441,6 +483,7 @@ cat > "$OUTPUT_SH" << 'BASH_HEADER'
 SEARCH_ROOT=""
 OUTPUT_FILE="findings_$(date +%Y%m%d_%H%M%S).txt"
 VERBOSE=false
+JOBS=$(nproc 2>/dev/null || echo 1)
 
 show_help() {
     cat << EOF
@@ -454,12 +497,14 @@ OPTIONS:
     -r, --root DIR      Root directory to search (REQUIRED)
     -o, --output FILE   Output file path (default: findings_YYYYMMDD_HHMMSS.txt)
     -v, --verbose       Show detailed output
+    -j, --jobs N        Number of sections to scan in parallel (default: CPU count)
     -h, --help          Show this help message
 
 EXAMPLES:
     ./filescanner_standalone.sh -r /var/www
     ./filescanner_standalone.sh -r /home/user/projects -v
     ./filescanner_standalone.sh -r /opt/app -o results.txt
+    ./filescanner_standalone.sh -r /opt/app -j 1
 
 EOF
 }
@@ -483,6 +528,10 @@ while [[ $# -gt 0 ]]; do
             VERBOSE=true
             shift
             ;;
+        -j|--jobs)
+            JOBS="$2"
+            shift 2
+            ;;
         *)
             echo "Unknown option: $1"
             exit 1
@@ -501,30 +550,125 @@ if [[ ! -d "$SEARCH_ROOT" ]]; then
     exit 1
 fi
 
+if [[ ! "$JOBS" =~ ^[1-9][0-9]*$ ]]; then
+    echo "Error: Jobs must be a positive integer: $JOBS"
+    exit 1
+fi
+
 # Create output directory
 OUTPUT_DIR=$(dirname "$OUTPUT_FILE")
 mkdir -p "$OUTPUT_DIR" 2>/dev/null
 
-run_section() {
+# Each section writes to its own buffer file so sections can run in
+# parallel and still be saved in config order
+SECTION_DIR=$(mktemp -d "${TMPDIR:-/tmp}/filescanner.XXXXXX") || exit 1
+trap 'rm -rf "$SECTION_DIR"' EXIT
+SECTION_COUNT=0
+SECTION_SAVED=0
+SECTION_PIDS=()
+
+# How a path under SEARCH_ROOT is printed by grep/find ("" if outside it)
+scan_path() {
+    local abs root
+    abs="$(cd "$(dirname "$1")" 2>/dev/null && pwd -P)/$(basename "$1")"
+    root="$(cd "$SEARCH_ROOT" && pwd -P)"
+    case "$abs" in
+        "${root%/}"/*) SCAN_PATH="${SEARCH_ROOT%/}/${abs#"${root%/}"/}" ;;
+        *)             SCAN_PATH="" ;;
+    esac
+}
+
+# Grep no longer writes straight to OUTPUT_FILE, so it cannot skip it (or
+# the section buffers) as its own output; drop those lines when saving
+scan_path "$OUTPUT_FILE"
+SKIP_OUTPUT="${SCAN_PATH:+$SCAN_PATH:}"
+scan_path "$SECTION_DIR"
+SKIP_SECTIONS="${SCAN_PATH:+$SCAN_PATH/}"
+export SKIP_OUTPUT SKIP_SECTIONS
+
+scan_section() {
     local name="$1"
     local command="$2"
     
-    if [[ "$VERBOSE" == true ]]; then
-        echo -e "\n=== $name ===" | tee -a "$OUTPUT_FILE"
-        echo "> Running: $command" | tee -a "$OUTPUT_FILE"
-    else
-        echo -e "\n=== $name ===" >> "$OUTPUT_FILE"
-    fi
+    echo -e "\n=== $name ==="
+    [[ "$VERBOSE" == true ]] && echo "> Running: $command"
     
     # Replace placeholder in command
     local actual_cmd="${command//\$SEARCH_ROOT/\"$SEARCH_ROOT\"}"
     
+    # Match raw bytes: the C locale skips grep's multibyte UTF-8 decoding
+    local -x LC_ALL=C
+    
     # Execute command
-    if [[ "$VERBOSE" == true ]]; then
-        eval "$actual_cmd" 2>/dev/null | tee -a "$OUTPUT_FILE" || true
-    else
-        eval "$actual_cmd" 2>/dev/null >> "$OUTPUT_FILE" || true
-    fi
+    eval "$actual_cmd" 2>/dev/null || true
+}
+
+# Append finished sections to the output in order and drop their buffers,
+# stopping at the first section that is still running
+save_sections() {
+    local buffer
+    while [[ $SECTION_SAVED -lt $SECTION_COUNT ]]; do
+        buffer="$SECTION_DIR/$SECTION_SAVED"
+        [[ -e "$buffer.done" ]] || break
+        if [[ -n "$SKIP_OUTPUT$SKIP_SECTIONS" ]]; then
+            awk '(ENVIRON["SKIP_OUTPUT"] == "" || index($0, ENVIRON["SKIP_OUTPUT"]) != 1) &&
+                 (ENVIRON["SKIP_SECTIONS"] == "" || index($0, ENVIRON["SKIP_SECTIONS"]) != 1)' \
+                "$buffer" > "$buffer.saved"
+            mv -f "$buffer.saved" "$buffer"
+        fi
+        if [[ "$VERBOSE" == true ]]; then
+            tee -a "$OUTPUT_FILE" < "$buffer"
+        else
+            cat "$buffer" >> "$OUTPUT_FILE"
+        fi
+        rm -f "$buffer" "$buffer.done"
+        SECTION_SAVED=$((SECTION_SAVED + 1))
+    done
+}
+
+# wait -n (any job) needs bash 4.3; older shells poll the .done markers
+WAIT_ANY=false
+if [[ ${BASH_VERSINFO[0]} -gt 4 || ( ${BASH_VERSINFO[0]} -eq 4 && ${BASH_VERSINFO[1]} -ge 3 ) ]]; then
+    WAIT_ANY=true
+fi
+
+# Wait for one section by PID
+wait_section() {
+    wait "${SECTION_PIDS[$1]}" 2>/dev/null
+    [[ -e "$SECTION_DIR/$1.done" ]] || : > "$SECTION_DIR/$1.done"
+}
+
+# Count sections that have not finished; OLDEST is the first of them
+count_running() {
+    local i
+    RUNNING=0
+    OLDEST=""
+    for ((i = SECTION_SAVED; i < SECTION_COUNT; i++)); do
+        if [[ ! -e "$SECTION_DIR/$i.done" ]]; then
+            RUNNING=$((RUNNING + 1))
+            [[ -z "$OLDEST" ]] && OLDEST=$i
+        fi
+    done
+}
+
+run_section() {
+    # Keep at most JOBS sections running; start the next one as soon as
+    # any section finishes, not only the oldest
+    count_running
+    while [[ $RUNNING -ge $JOBS ]]; do
+        if [[ "$WAIT_ANY" == true ]]; then
+            wait -n 2>/dev/null || [[ $? -ne 127 ]] || wait_section "$OLDEST"
+        else
+            sleep 0.1
+        fi
+        count_running
+    done
+    save_sections
+    
+    local buffer="$SECTION_DIR/$SECTION_COUNT"
+    { scan_section "$1" "$2" > "$buffer"; : > "$buffer.done"; } &
+    SECTION_PIDS[$SECTION_COUNT]=$!
+    SECTION_COUNT=$((SECTION_COUNT + 1))
 }
 
 # Write header
@@ -547,15 +691,21 @@ for ((i=0; i<${#SECTION_NAMES[@]}; i++)); do
     linux_cmd="${LINUX_COMMANDS[$i]}"
     
     # Escape single quotes for bash
-    linux_cmd_escaped=$(echo "$linux_cmd" | sed "s/'/'\\\\''/g")
+    linux_cmd_escaped="${linux_cmd//\'/\'\\\'\'}"
     
-    cat >> "$OUTPUT_SH" << EOF
+    cat << EOF
 run_section '$section_name' '$linux_cmd_escaped'
 EOF
 done
 
 # Add footer
-cat >> "$OUTPUT_SH" << 'BASH_FOOTER'
+cat << 'BASH_FOOTER'
+
+# Save the remaining sections in order as each one finishes
+while [[ $SECTION_SAVED -lt $SECTION_COUNT ]]; do
+    wait_section "$SECTION_SAVED"
+    save_sections
+done
 
 # Footer
 {
@@ -568,6 +718,7 @@ cat >> "$OUTPUT_SH" << 'BASH_FOOTER'
 
 echo "Results saved to: $OUTPUT_FILE"
 BASH_FOOTER
+} > "$OUTPUT_SH"
 
 chmod +x "$OUTPUT_SH"
 